@@ -14,58 +14,312 @@ Environment Variables:
 import os
 import sys
 import json
+import time
+import asyncio
 import argparse
+import functools
+import itertools
+from collections import OrderedDict
 import requests
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode
+from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encode/decode, falls back to json
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:  # Optional: C ISO 8601 parser, falls back to fromisoformat
+    parse_datetime = None
+
+try:
+    import ijson
+except ImportError:  # Optional: only used to stream large execution payloads
+    ijson = None
+
 # Configuration
 N8N_URL = os.getenv('N8N_API_URL', 'http://localhost:5678')
 API_KEY = os.getenv('N8N_API_KEY', '')
 
+# Keep-alive connections kept per host; worker threads stay within this so
+# concurrent requests reuse pooled connections instead of opening extra ones
+POOL_MAXSIZE = 16
+
+# Largest page the executions endpoint returns; bigger limits follow nextCursor
+MAX_PAGE_SIZE = 250
+
+# Parse paths of individual output items inside runData (node names may contain dots)
+RUN_DATA_PREFIX = 'data.resultData.runData.'
+OUTPUT_ITEM_SUFFIX = '.item.data.main.item.item'
+
+# Streaming trades parse CPU (a Python step per JSON token) for memory, so it
+# only pays off for bodies at least this large once decoded; smaller ones are
+# parsed eagerly
+STREAM_MIN_BYTES = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+STATUS_ICONS = {'success': '✓', 'error': '✗', 'waiting': '⏳', 'running': '▶'}
+
+# Execution IDs a watcher remembers; the oldest are forgotten beyond this
+MAX_SEEN_IDS = 10000
+
+# Executions in these states are final and safe to cache for longer
+FINISHED_STATUSES = {'success', 'error'}
+
+
+def _cache_ttl(endpoint: str, payload: Dict) -> int:
+    """Seconds a GET response for endpoint may be served without revalidation."""
+    if endpoint == '/api/v1/executions':
+        return 3
+    if endpoint.startswith('/api/v1/executions/'):
+        return 300 if payload.get('status') in FINISHED_STATUSES else 0
+    if endpoint.startswith('/api/v1/workflows/'):
+        return 60
+    return 0
+
+
+def _cache_key(url: str, params: Optional[Dict]) -> str:
+    """Cache key with a sorted query string so equal parameter sets share an entry."""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+def decode_json(data: bytes) -> Any:
+    """Decode a JSON response body."""
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError as e:
+        # Raise what response.json() raises, so API error handling still catches it
+        raise requests.exceptions.JSONDecodeError(
+            getattr(e, 'msg', str(e)), getattr(e, 'doc', ''), getattr(e, 'pos', 0)
+        ) from e
+
+
+def encode_json(obj: Any) -> bytes:
+    """Encode obj as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def write_json(obj: Any) -> None:
+    """Print obj as indented JSON, written as bytes so any stdout encoding works."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(encode_json(obj) + b'\n')
+
+
+class _ChunkReader:
+    """Minimal file-like wrapper so ijson can read an iterator of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes with read(0) to detect bytes vs str
+            return b''
+        return next(self._chunks, b'')
+
 
 class ExecutionManager:
     """Manage and debug n8n executions."""
 
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(self, base_url: str, api_key: str, use_cache: bool = True):
         self.base_url = base_url.rstrip('/')
+        self.use_cache = use_cache
+        # url -> (expires_at, payload); expired entries are kept as a fallback
+        self._cache: Dict[str, tuple] = {}
+        # url -> ETag of the cached payload, used to revalidate expired entries
+        self._etags: Dict[str, str] = {}
         self.headers = {
             'X-N8N-API-KEY': api_key,
             'Content-Type': 'application/json'
         }
+        # One pooled session so repeated GETs reuse the keep-alive connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update(self.headers)
 
-    def _get(self, endpoint: str) -> Dict:
-        """Make GET request."""
+    def _get(self, endpoint: str, params: Optional[Dict] = None, revalidate: bool = False) -> Dict:
+        """Make GET request; revalidate skips the TTL and always asks the server."""
         url = f"{self.base_url}{endpoint}"
-        response = requests.get(url, headers=self.headers, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        key = _cache_key(url, params)
+        cached = self._cache.get(key)
+        if cached and not revalidate and time.monotonic() < cached[0]:
+            return cached[1]
+
+        # Revalidate an expired entry; the server answers 304 if it is unchanged
+        headers = {}
+        if cached and key in self._etags:
+            headers['If-None-Match'] = self._etags[key]
+
+        try:
+            response = self.session.get(url, params=params, headers=headers, timeout=30)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if not cached:
+                raise
+            print(f"Warning: {e}; using cached response", file=sys.stderr)
+            return cached[1]
+
+        if response.status_code == 304 and cached:
+            payload = cached[1]
+        else:
+            response.raise_for_status()
+            payload = decode_json(response.content)
+            if 'ETag' in response.headers:
+                self._etags[key] = response.headers['ETag']
+
+        if self.use_cache:
+            self._cache[key] = (time.monotonic() + _cache_ttl(endpoint, payload), payload)
+        return payload
+
+    def _get_stream(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """GET an execution, parsing incrementally with output item bodies dropped.
+
+        Every item in runData[node][run].data.main[branch] is replaced by an
+        empty dict, so item counts stay correct without building the item data.
+        This lowers peak memory roughly in proportion to the item data, but
+        parsing is slower than an eager decode, so bodies that turn out to
+        be under STREAM_MIN_BYTES once decompressed are decoded whole (and
+        cached) instead.
+        """
+        url = f"{self.base_url}{endpoint}"
+        key = _cache_key(url, params)
+        cached = self._cache.get(key)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        try:
+            response = self.session.get(url, params=params, stream=True, timeout=30)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if not cached:
+                raise
+            print(f"Warning: {e}; using cached response", file=sys.stderr)
+            return cached[1]
+
+        with response:
+            response.raise_for_status()
+
+            # Content-Length is the compressed size under gzip and missing for
+            # chunked bodies, so buffer decoded bytes up to the threshold instead
+            chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            head = []
+            size = 0
+            for chunk in chunks:
+                head.append(chunk)
+                size += len(chunk)
+                if size >= STREAM_MIN_BYTES:
+                    break
+            else:
+                payload = decode_json(b''.join(head))
+                if self.use_cache:
+                    if 'ETag' in response.headers:
+                        self._etags[key] = response.headers['ETag']
+                    self._cache[key] = (time.monotonic() + _cache_ttl(endpoint, payload), payload)
+                return payload
+
+            builder = ijson.ObjectBuilder()
+            skip_depth = 0
+            reader = _ChunkReader(itertools.chain(head, chunks))
+            try:
+                for prefix, event, value in ijson.parse(reader, use_float=True):
+                    if skip_depth:
+                        if event in ('start_map', 'start_array'):
+                            skip_depth += 1
+                        elif event in ('end_map', 'end_array'):
+                            skip_depth -= 1
+                        continue
+                    if (event == 'start_map' and prefix.endswith(OUTPUT_ITEM_SUFFIX)
+                            and prefix.startswith(RUN_DATA_PREFIX)):
+                        builder.event('start_map', None)
+                        builder.event('end_map', None)
+                        skip_depth = 1
+                        continue
+                    builder.event(event, value)
+            except ijson.JSONError as e:
+                # A RequestException, like decode_json raises for eager bodies
+                raise requests.exceptions.InvalidJSONError(
+                    f"Invalid JSON response: {str(e).splitlines()[0]}"
+                ) from e
+        return builder.value
 
     def list_executions(
         self,
         workflow_id: Optional[str] = None,
         status: Optional[str] = None,
-        limit: int = 20
+        limit: int = 20,
+        include_data: bool = False,
+        revalidate: bool = False
     ) -> List[Dict]:
-        """List executions with filters."""
-        params = [f"limit={limit}"]
+        """List executions with filters, paging through nextCursor up to limit."""
+        params = {}
         if workflow_id:
-            params.append(f"workflowId={workflow_id}")
+            params['workflowId'] = workflow_id
         if status:
-            params.append(f"status={status}")
-        query = '&'.join(params)
-        result = self._get(f'/api/v1/executions?{query}')
-        return result.get('data', [])
-
-    def get_execution(self, execution_id: str) -> Dict:
-        """Get execution with full data."""
-        return self._get(f'/api/v1/executions/{execution_id}?includeData=true')
+            params['status'] = status
+        if include_data:
+            params['includeData'] = 'true'
+
+        executions = []
+        while len(executions) < limit:
+            # Ask only for what is still missing so the last page is not over-fetched
+            params['limit'] = min(limit - len(executions), MAX_PAGE_SIZE)
+            result = self._get('/api/v1/executions', params, revalidate=revalidate)
+            executions.extend(result.get('data', []))
+            cursor = result.get('nextCursor')
+            if not cursor:
+                break
+            params['cursor'] = cursor
+        return executions[:limit]
+
+    def get_execution(self, execution_id: str, include_data: bool = True) -> Dict:
+        """Get execution; without data, runData and error details are omitted."""
+        return self._get(
+            f'/api/v1/executions/{execution_id}',
+            {'includeData': str(include_data).lower()}
+        )
+
+    def get_execution_summary(self, execution_id: str) -> Dict:
+        """Get execution with node results but without output item data."""
+        if ijson is None:
+            return self.get_execution(execution_id)
+        return self._get_stream(f'/api/v1/executions/{execution_id}', {'includeData': 'true'})
 
     def get_workflow(self, workflow_id: str) -> Dict:
         """Get workflow info."""
         return self._get(f'/api/v1/workflows/{workflow_id}')
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_timestamp(ts: str) -> datetime:
+    """Parse ISO timestamp (cached, the same values recur across rows)."""
+    if parse_datetime is not None:
+        return parse_datetime(ts)
+    if sys.version_info < (3, 11):  # fromisoformat accepts 'Z' from 3.11
+        ts = ts.replace('Z', '+00:00')
+    return datetime.fromisoformat(ts)
+
+
+@functools.lru_cache(maxsize=4096)
 def format_timestamp(ts: str) -> str:
     """Format ISO timestamp."""
     if not ts:
@@ -78,8 +332,8 @@ def format_duration(start: str, stop: str) -> str:
     if not start or not stop:
         return 'N/A'
     try:
-        start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-        stop_dt = datetime.fromisoformat(stop.replace('Z', '+00:00'))
+        start_dt = parse_timestamp(start)
+        stop_dt = parse_timestamp(stop)
         duration = stop_dt - start_dt
         total_seconds = duration.total_seconds()
         if total_seconds < 1:
@@ -94,6 +348,11 @@ def format_duration(start: str, stop: str) -> str:
         return 'N/A'
 
 
+def write_lines(lines: List[str]) -> None:
+    """Write command output with a single write instead of a print() per line."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
 def cmd_list(manager: ExecutionManager, args):
     """List executions."""
     executions = manager.list_executions(
@@ -102,167 +361,203 @@ def cmd_list(manager: ExecutionManager, args):
         limit=args.limit
     )
 
-    status_icons = {
-        'success': '✓',
-        'error': '✗',
-        'waiting': '⏳',
-        'running': '▶',
-        'unknown': '?'
-    }
-
-    print(f"{'ID':<10} {'Status':<10} {'Workflow':<10} {'Started':<20} {'Duration':<10}")
-    print("-" * 70)
+    out = []
+    out.append(f"{'ID':<10} {'Status':<10} {'Workflow':<10} {'Started':<20} {'Duration':<10}")
+    out.append("-" * 70)
 
     for ex in executions:
         status = ex.get('status', 'unknown')
-        icon = status_icons.get(status, '?')
+        icon = STATUS_ICONS.get(status, '?')
         duration = format_duration(ex.get('startedAt'), ex.get('stoppedAt'))
 
-        print(f"{ex['id']:<10} {icon} {status:<8} {ex.get('workflowId', 'N/A'):<10} "
-              f"{format_timestamp(ex.get('startedAt')):<20} {duration:<10}")
+        out.append(f"{ex['id']:<10} {icon} {status:<8} {ex.get('workflowId', 'N/A'):<10} "
+                   f"{format_timestamp(ex.get('startedAt')):<20} {duration:<10}")
+
+    out.append(f"\nTotal: {len(executions)} executions")
 
-    print(f"\nTotal: {len(executions)} executions")
+    write_lines(out)
 
 
 def cmd_get(manager: ExecutionManager, args):
     """Get execution details."""
     execution = manager.get_execution(args.id)
 
-    print(f"Execution: {execution['id']}")
-    print(f"Workflow:  {execution.get('workflowId', 'N/A')}")
-    print(f"Status:    {execution.get('status', 'N/A')}")
-    print(f"Mode:      {execution.get('mode', 'N/A')}")
-    print(f"Started:   {format_timestamp(execution.get('startedAt'))}")
-    print(f"Stopped:   {format_timestamp(execution.get('stoppedAt'))}")
-    print(f"Duration:  {format_duration(execution.get('startedAt'), execution.get('stoppedAt'))}")
+    out = []
+    out.append(f"Execution: {execution['id']}")
+    out.append(f"Workflow:  {execution.get('workflowId', 'N/A')}")
+    out.append(f"Status:    {execution.get('status', 'N/A')}")
+    out.append(f"Mode:      {execution.get('mode', 'N/A')}")
+    out.append(f"Started:   {format_timestamp(execution.get('startedAt'))}")
+    out.append(f"Stopped:   {format_timestamp(execution.get('stoppedAt'))}")
+    out.append(f"Duration:  {format_duration(execution.get('startedAt'), execution.get('stoppedAt'))}")
 
     # Error info
-    error = execution.get('data', {}).get('resultData', {}).get('error')
+    result_data = (execution.get('data') or {}).get('resultData') or {}
+    error = result_data.get('error')
     if error:
-        print(f"\n--- ERROR ---")
-        print(f"Message: {error.get('message', str(error))}")
+        out.append(f"\n--- ERROR ---")
+        out.append(f"Message: {error.get('message', str(error))}")
         if error.get('stack'):
-            print(f"Stack: {error['stack'][:500]}...")
+            out.append(f"Stack: {error['stack'][:500]}...")
+
+    if args.json:
+        out.append(f"\n--- Full JSON ---")
 
+    write_lines(out)
     if args.json:
-        print(f"\n--- Full JSON ---")
-        print(json.dumps(execution, indent=2))
+        write_json(execution)
 
 
 def cmd_debug(manager: ExecutionManager, args):
     """Detailed debug output for execution."""
-    execution = manager.get_execution(args.id)
+    if args.verbose:
+        execution = manager.get_execution(args.id)
+    else:
+        # Sample data is not shown, so skip building the output items
+        execution = manager.get_execution_summary(args.id)
 
-    print("=" * 80)
-    print(f"EXECUTION DEBUG: {execution['id']}")
-    print("=" * 80)
+    out = []
+    out.append("=" * 80)
+    out.append(f"EXECUTION DEBUG: {execution['id']}")
+    out.append("=" * 80)
 
     # Basic info
-    print(f"\nWorkflow ID: {execution.get('workflowId')}")
-    print(f"Status:      {execution.get('status')}")
-    print(f"Mode:        {execution.get('mode')}")
-    print(f"Started:     {format_timestamp(execution.get('startedAt'))}")
-    print(f"Stopped:     {format_timestamp(execution.get('stoppedAt'))}")
-    print(f"Duration:    {format_duration(execution.get('startedAt'), execution.get('stoppedAt'))}")
+    out.append(f"\nWorkflow ID: {execution.get('workflowId')}")
+    out.append(f"Status:      {execution.get('status')}")
+    out.append(f"Mode:        {execution.get('mode')}")
+    out.append(f"Started:     {format_timestamp(execution.get('startedAt'))}")
+    out.append(f"Stopped:     {format_timestamp(execution.get('stoppedAt'))}")
+    out.append(f"Duration:    {format_duration(execution.get('startedAt'), execution.get('stoppedAt'))}")
 
     # Get workflow name
     try:
         workflow = manager.get_workflow(execution.get('workflowId'))
-        print(f"Workflow:    {workflow.get('name')}")
+        out.append(f"Workflow:    {workflow.get('name')}")
     except Exception:
         pass
 
     # Node execution details
-    run_data = execution.get('data', {}).get('resultData', {}).get('runData', {})
+    result_data = (execution.get('data') or {}).get('resultData') or {}
+    run_data = result_data.get('runData') or {}
 
     if run_data:
-        print("\n" + "-" * 40)
-        print("NODE EXECUTION DETAILS")
-        print("-" * 40)
+        out.append("\n" + "-" * 40)
+        out.append("NODE EXECUTION DETAILS")
+        out.append("-" * 40)
 
-        # Sort by execution time
         node_times = []
         for node_name, node_data in run_data.items():
             if node_data:
                 exec_time = node_data[0].get('executionTime', 0)
                 node_times.append((node_name, exec_time, node_data[0]))
 
-        node_times.sort(key=lambda x: x[0])  # Sort by name for execution order
+        # runData is usually already in execution order, so this sort is
+        # near-linear; startTime makes the order explicit
+        node_times.sort(key=lambda x: x[2].get('startTime', 0))
 
         for node_name, exec_time, data in node_times:
             status = "✓" if 'error' not in data else "✗"
-            items_out = 0
-            if data.get('data', {}).get('main'):
-                for branch in data['data']['main']:
-                    if branch:
-                        items_out += len(branch)
+            main = (data.get('data') or {}).get('main') or []
+            items_out = sum(len(branch) for branch in main if branch)
 
-            print(f"\n{status} {node_name}")
-            print(f"   Execution time: {exec_time}ms")
-            print(f"   Items output: {items_out}")
+            out.append(f"\n{status} {node_name}")
+            out.append(f"   Execution time: {exec_time}ms")
+            out.append(f"   Items output: {items_out}")
 
             # Show error if any
             if 'error' in data:
-                print(f"   ERROR: {data['error'].get('message', data['error'])}")
+                out.append(f"   ERROR: {data['error'].get('message', data['error'])}")
 
             # Show sample data (first item)
-            if args.verbose and data.get('data', {}).get('main'):
-                for i, branch in enumerate(data['data']['main']):
-                    if branch and len(branch) > 0:
-                        print(f"   Output[{i}] sample: {json.dumps(branch[0].get('json', {}), indent=6)[:200]}...")
+            if args.verbose:
+                for i, branch in enumerate(main):
+                    if branch:
+                        out.append(f"   Output[{i}] sample: {json.dumps(branch[0].get('json', {}), indent=6)[:200]}...")
 
     # Last node executed
-    last_node = execution.get('data', {}).get('resultData', {}).get('lastNodeExecuted')
+    last_node = result_data.get('lastNodeExecuted')
     if last_node:
-        print(f"\nLast node executed: {last_node}")
+        out.append(f"\nLast node executed: {last_node}")
 
     # Error details
-    error = execution.get('data', {}).get('resultData', {}).get('error')
+    error = result_data.get('error')
     if error:
-        print("\n" + "=" * 40)
-        print("ERROR DETAILS")
-        print("=" * 40)
-        print(f"Message: {error.get('message', str(error))}")
-        print(f"Node: {error.get('node', 'N/A')}")
+        out.append("\n" + "=" * 40)
+        out.append("ERROR DETAILS")
+        out.append("=" * 40)
+        out.append(f"Message: {error.get('message', str(error))}")
+        out.append(f"Node: {error.get('node', 'N/A')}")
         if error.get('description'):
-            print(f"Description: {error['description']}")
+            out.append(f"Description: {error['description']}")
         if error.get('stack') and args.verbose:
-            print(f"\nStack trace:\n{error['stack']}")
+            out.append(f"\nStack trace:\n{error['stack']}")
+
+    write_lines(out)
 
 
 def cmd_errors(manager: ExecutionManager, args):
     """List recent failed executions."""
-    executions = manager.list_executions(status='error', limit=args.limit)
+    # Ask for execution data inline to avoid one GET per error
+    try:
+        executions = manager.list_executions(status='error', limit=args.limit, include_data=True)
+    except requests.exceptions.HTTPError as e:
+        if e.response is None or e.response.status_code != 400:
+            raise
+        executions = manager.list_executions(status='error', limit=args.limit)
 
     if not executions:
         print("No failed executions found")
         return
 
-    print(f"Recent Failed Executions (last {args.limit}):")
-    print("-" * 80)
+    out = []
+    out.append(f"Recent Failed Executions (last {args.limit}):")
+    out.append("-" * 80)
 
-    for ex in executions:
-        execution = manager.get_execution(ex['id'])
-        error = execution.get('data', {}).get('resultData', {}).get('error', {})
-        last_node = execution.get('data', {}).get('resultData', {}).get('lastNodeExecuted', 'N/A')
+    def workflow_name(workflow_id: str) -> Optional[str]:
+        try:
+            return manager.get_workflow(workflow_id).get('name')
+        except requests.exceptions.RequestException:
+            return None
+
+    # Servers without inline data support leave 'data' out; fetch those
+    # concurrently over the pooled session, plus each distinct workflow once
+    workflow_ids = list({ex['workflowId'] for ex in executions if ex.get('workflowId')})
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        names = dict(zip(workflow_ids, pool.map(workflow_name, workflow_ids)))
+        details = list(pool.map(
+            lambda e: (e, e if 'data' in e else manager.get_execution(e['id'])),
+            executions
+        ))
+
+    for ex, execution in details:
+        result_data = (execution.get('data') or {}).get('resultData') or {}
+        error = result_data.get('error') or {}
+        last_node = result_data.get('lastNodeExecuted', 'N/A')
 
-        print(f"\n[{ex['id']}] Workflow: {ex.get('workflowId')} | {format_timestamp(ex.get('startedAt'))}")
-        print(f"  Last node: {last_node}")
-        print(f"  Error: {error.get('message', 'Unknown error')[:100]}")
+        workflow = ex.get('workflowId')
+        if names.get(workflow):
+            workflow = f"{workflow} ({names[workflow]})"
+
+        out.append(f"\n[{ex['id']}] Workflow: {workflow} | {format_timestamp(ex.get('startedAt'))}")
+        out.append(f"  Last node: {last_node}")
+        out.append(f"  Error: {error.get('message', 'Unknown error')[:100]}")
+
+    write_lines(out)
 
 
 def cmd_stats(manager: ExecutionManager, args):
     """Show execution statistics."""
+    # One window of the most recent executions, so every status is counted
+    # over the same period; cursor paging covers limits above one page
     all_execs = manager.list_executions(
         workflow_id=args.workflow_id,
-        limit=100
+        limit=args.limit
     )
 
     if not all_execs:
         print("No executions found")
         return
 
-    # Count by status
     status_counts = {}
     total_duration = 0
     count_with_duration = 0
@@ -273,72 +568,93 @@ def cmd_stats(manager: ExecutionManager, args):
 
         if ex.get('startedAt') and ex.get('stoppedAt'):
             try:
-                start = datetime.fromisoformat(ex['startedAt'].replace('Z', '+00:00'))
-                stop = datetime.fromisoformat(ex['stoppedAt'].replace('Z', '+00:00'))
+                start = parse_timestamp(ex['startedAt'])
+                stop = parse_timestamp(ex['stoppedAt'])
                 total_duration += (stop - start).total_seconds()
                 count_with_duration += 1
             except Exception:
                 pass
 
-    print("Execution Statistics")
-    print("-" * 40)
-    print(f"Total executions: {len(all_execs)}")
+    total = len(all_execs)
+
+    out = []
+    out.append("Execution Statistics")
+    out.append("-" * 40)
+    out.append(f"Total executions: {total}")
 
     for status, count in sorted(status_counts.items()):
-        pct = count / len(all_execs) * 100
-        print(f"  {status}: {count} ({pct:.1f}%)")
+        pct = count / total * 100
+        out.append(f"  {status}: {count} ({pct:.1f}%)")
 
     if count_with_duration > 0:
         avg_duration = total_duration / count_with_duration
-        print(f"\nAverage duration: {avg_duration:.2f}s")
+        out.append(f"\nAverage duration: {avg_duration:.2f}s")
 
     # Success rate
     success = status_counts.get('success', 0)
     error = status_counts.get('error', 0)
     if success + error > 0:
         success_rate = success / (success + error) * 100
-        print(f"Success rate: {success_rate:.1f}%")
+        out.append(f"Success rate: {success_rate:.1f}%")
 
+    write_lines(out)
 
-def cmd_watch(manager: ExecutionManager, args):
-    """Watch for new executions."""
-    import time
-
-    print(f"Watching for executions... (Ctrl+C to stop)")
-    print("-" * 60)
 
-    seen_ids = set()
+async def watch_workflow(manager: ExecutionManager, workflow_id: Optional[str], interval: int):
+    """Poll one workflow (or all workflows when None) for new executions."""
+    seen_ids = OrderedDict()  # insertion-ordered, so the oldest ID is evicted first
     last_check = None
 
     while True:
-        try:
-            executions = manager.list_executions(
-                workflow_id=args.workflow_id,
-                limit=10
-            )
+        # The blocking request runs in a worker thread so the loop stays responsive.
+        # Each tick revalidates, so an unchanged list costs a bodiless 304.
+        executions = await asyncio.to_thread(
+            manager.list_executions,
+            workflow_id=workflow_id,
+            limit=10,
+            revalidate=True
+        )
+
+        for ex in reversed(executions):
+            if ex['id'] not in seen_ids:
+                seen_ids[ex['id']] = None
+                if len(seen_ids) > MAX_SEEN_IDS:
+                    seen_ids.popitem(last=False)
+                if last_check is not None:  # Skip first batch
+                    icon = STATUS_ICONS.get(ex.get('status', ''), '?')
+                    print(f"[{datetime.now().strftime('%H:%M:%S')}] {icon} "
+                          f"Execution {ex['id']} - Workflow {ex.get('workflowId')} - "
+                          f"{ex.get('status')}")
+
+        last_check = datetime.now()
+        await asyncio.sleep(interval)
+
+
+async def watch_executions(manager: ExecutionManager, workflow_ids: List[Optional[str]], interval: int):
+    """Watch several workflows concurrently."""
+    # to_thread's default executor can outgrow the connection pool
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=POOL_MAXSIZE)
+    )
+    await asyncio.gather(*[watch_workflow(manager, wf, interval) for wf in workflow_ids])
 
-            for ex in reversed(executions):
-                if ex['id'] not in seen_ids:
-                    seen_ids.add(ex['id'])
-                    if last_check is not None:  # Skip first batch
-                        status_icons = {'success': '✓', 'error': '✗', 'waiting': '⏳', 'running': '▶'}
-                        icon = status_icons.get(ex.get('status', ''), '?')
-                        print(f"[{datetime.now().strftime('%H:%M:%S')}] {icon} "
-                              f"Execution {ex['id']} - Workflow {ex.get('workflowId')} - "
-                              f"{ex.get('status')}")
 
-            last_check = datetime.now()
-            time.sleep(args.interval)
+def cmd_watch(manager: ExecutionManager, args):
+    """Watch for new executions."""
+    print(f"Watching for executions... (Ctrl+C to stop)")
+    print("-" * 60)
 
-        except KeyboardInterrupt:
-            print("\nStopped")
-            break
+    try:
+        asyncio.run(watch_executions(manager, args.workflow_id or [None], args.interval))
+    except KeyboardInterrupt:
+        print("\nStopped")
 
 
 def main():
     parser = argparse.ArgumentParser(description='n8n Execution Manager')
     parser.add_argument('--url', default=N8N_URL, help='n8n API URL')
     parser.add_argument('--key', default=API_KEY, help='API key')
+    parser.add_argument('--no-cache', action='store_true', help='Disable response cache')
 
     subparsers = parser.add_subparsers(dest='command', help='Commands')
 
@@ -365,10 +681,12 @@ def main():
     # Statistics
     p_stats = subparsers.add_parser('stats', help='Execution statistics')
     p_stats.add_argument('--workflow-id', '-w', help='Filter by workflow')
+    p_stats.add_argument('--limit', '-l', type=int, default=100, help='Most recent executions to include')
 
     # Watch
     p_watch = subparsers.add_parser('watch', help='Watch for new executions')
-    p_watch.add_argument('--workflow-id', '-w', help='Filter by workflow')
+    p_watch.add_argument('--workflow-id', '-w', action='append',
+                         help='Filter by workflow (repeatable)')
     p_watch.add_argument('--interval', '-i', type=int, default=5, help='Check interval (seconds)')
 
     args = parser.parse_args()
@@ -381,7 +699,7 @@ def main():
         print("Error: N8N_API_KEY not set", file=sys.stderr)
         sys.exit(1)
 
-    manager = ExecutionManager(args.url, args.key)
+    manager = ExecutionManager(args.url, args.key, use_cache=not args.no_cache)
 
     commands = {
         'list': cmd_list,
@@ -14,36 +14,130 @@ Environment Variables:
 import os
 import sys
 import json
+import time
 import argparse
 import requests
+from urllib.parse import urlencode
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encode/decode, falls back to json
+    orjson = None
+
 # Configuration
 N8N_URL = os.getenv('N8N_API_URL', 'http://localhost:5678')
 API_KEY = os.getenv('N8N_API_KEY', '')
 
+STATUS_ICONS = {'success': '✓', 'error': '✗', 'waiting': '⏳', 'running': '▶'}
+
+# Executions in these states are final and safe to cache for longer
+FINISHED_STATUSES = {'success', 'error'}
+
+
+def _cache_ttl(endpoint: str, payload: Dict) -> int:
+    """Seconds a GET response for endpoint may be served without revalidation."""
+    if endpoint == '/api/v1/executions':
+        return 3
+    if endpoint.startswith('/api/v1/executions/'):
+        return 300 if payload.get('status') in FINISHED_STATUSES else 0
+    if endpoint.startswith('/api/v1/workflows/'):
+        return 60
+    return 0
+
+
+def _cache_key(url: str, params: Optional[Dict]) -> str:
+    """Cache key with a sorted query string so equal parameter sets share an entry."""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+def decode_json(data: bytes) -> Any:
+    """Decode a JSON response body."""
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError as e:
+        # Raise what response.json() raises, so API error handling still catches it
+        raise requests.exceptions.JSONDecodeError(
+            getattr(e, 'msg', str(e)), getattr(e, 'doc', ''), getattr(e, 'pos', 0)
+        ) from e
+
+
+def encode_json(obj: Any) -> bytes:
+    """Encode obj as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def write_json(obj: Any) -> None:
+    """Print obj as indented JSON, written as bytes so any stdout encoding works."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(encode_json(obj) + b'\n')
+
 
 class N8nClient:
     """n8n REST API client."""
 
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(self, base_url: str, api_key: str, use_cache: bool = True):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
+        self.use_cache = use_cache
+        # url -> (expires_at, payload); expired entries are kept as a fallback
+        self._cache: Dict[str, tuple] = {}
+        # url -> ETag of the cached payload, used to revalidate expired entries
+        self._etags: Dict[str, str] = {}
         self.session = requests.Session()
         self.session.headers.update({
             'X-N8N-API-KEY': api_key,
             'Content-Type': 'application/json'
         })
 
-    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None
+    ) -> Dict:
         """Make API request."""
         url = f"{self.base_url}{endpoint}"
+        key = _cache_key(url, params)
+        cached = None
+        if method == 'GET':
+            cached = self._cache.get(key)
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+        else:
+            # Any write may change what earlier GETs returned
+            self._cache.clear()
+            self._etags.clear()
+
+        # Revalidate an expired entry; the server answers 304 if it is unchanged
+        headers = {}
+        if cached and key in self._etags:
+            headers['If-None-Match'] = self._etags[key]
+
         try:
-            response = self.session.request(method, url, json=data, timeout=30)
+            response = self.session.request(
+                method, url, json=data, params=params, headers=headers, timeout=30
+            )
             response.raise_for_status()
-            return response.json() if response.text else {}
+            if response.status_code == 304 and cached:
+                payload = cached[1]
+            else:
+                payload = decode_json(response.content) if response.content else {}
+                if method == 'GET' and 'ETag' in response.headers:
+                    self._etags[key] = response.headers['ETag']
         except requests.exceptions.RequestException as e:
+            if cached and isinstance(e, (requests.exceptions.ConnectionError,
+                                         requests.exceptions.Timeout)):
+                print(f"Warning: {e}; using cached response", file=sys.stderr)
+                return cached[1]
             print(f"Error: {e}", file=sys.stderr)
             if hasattr(e, 'response') and e.response is not None:
                 try:
@@ -52,14 +146,18 @@ class N8nClient:
                     print(f"Response: {e.response.text}", file=sys.stderr)
             sys.exit(1)
 
+        if method == 'GET' and self.use_cache:
+            self._cache[key] = (time.monotonic() + _cache_ttl(endpoint, payload), payload)
+        return payload
+
     # Workflow operations
 
     def list_workflows(self, active_only: bool = False, limit: int = 100) -> List[Dict]:
         """List all workflows."""
-        params = f"?limit={limit}"
+        params = {'limit': limit}
         if active_only:
-            params += "&active=true"
-        result = self._request('GET', f'/api/v1/workflows{params}')
+            params['active'] = 'true'
+        result = self._request('GET', '/api/v1/workflows', params=params)
         return result.get('data', [])
 
     def get_workflow(self, workflow_id: str) -> Dict:
@@ -95,20 +193,20 @@ class N8nClient:
         limit: int = 20
     ) -> List[Dict]:
         """List executions with optional filters."""
-        params = [f"limit={limit}"]
+        params = {'limit': limit}
         if workflow_id:
-            params.append(f"workflowId={workflow_id}")
+            params['workflowId'] = workflow_id
         if status:
-            params.append(f"status={status}")
-        query = '&'.join(params)
-        result = self._request('GET', f'/api/v1/executions?{query}')
+            params['status'] = status
+        result = self._request('GET', '/api/v1/executions', params=params)
         return result.get('data', [])
 
     def get_execution(self, execution_id: str, include_data: bool = True) -> Dict:
         """Get execution details."""
         return self._request(
             'GET',
-            f'/api/v1/executions/{execution_id}?includeData={str(include_data).lower()}'
+            f'/api/v1/executions/{execution_id}',
+            params={'includeData': str(include_data).lower()}
         )
 
     def delete_execution(self, execution_id: str) -> None:
@@ -140,9 +238,8 @@ def format_workflow(workflow: Dict, verbose: bool = False) -> str:
 
 def format_execution(execution: Dict) -> str:
     """Format execution for display."""
-    status_icons = {'success': '✓', 'error': '✗', 'waiting': '⏳', 'running': '▶'}
     status = execution.get('status', 'unknown')
-    icon = status_icons.get(status, '?')
+    icon = STATUS_ICONS.get(status, '?')
     started = execution.get('startedAt', 'N/A')
     if started != 'N/A':
         started = started[:19].replace('T', ' ')
@@ -155,7 +252,7 @@ def cmd_list(client: N8nClient, args):
     """List workflows."""
     workflows = client.list_workflows(active_only=args.active)
     if args.json:
-        print(json.dumps(workflows, indent=2))
+        write_json(workflows)
     else:
         for wf in workflows:
             print(format_workflow(wf))
@@ -166,7 +263,7 @@ def cmd_get(client: N8nClient, args):
     """Get workflow."""
     workflow = client.get_workflow(args.id)
     if args.json or args.verbose:
-        print(json.dumps(workflow, indent=2))
+        write_json(workflow)
     else:
         print(format_workflow(workflow))
         print(f"\nNodes ({len(workflow.get('nodes', []))}):")
@@ -176,7 +273,7 @@ def cmd_get(client: N8nClient, args):
 
 def cmd_create(client: N8nClient, args):
     """Create workflow from file."""
-    with open(args.file, 'r') as f:
+    with open(args.file, 'r', encoding='utf-8') as f:
         workflow_data = json.load(f)
 
     result = client.create_workflow(workflow_data)
@@ -185,7 +282,7 @@ def cmd_create(client: N8nClient, args):
 
 def cmd_update(client: N8nClient, args):
     """Update workflow from file."""
-    with open(args.file, 'r') as f:
+    with open(args.file, 'r', encoding='utf-8') as f:
         workflow_data = json.load(f)
 
     result = client.update_workflow(args.id, workflow_data)
@@ -221,8 +318,8 @@ def cmd_export(client: N8nClient, args):
     workflow = client.get_workflow(args.id)
     output = args.output or f"workflow-{args.id}.json"
 
-    with open(output, 'w') as f:
-        json.dump(workflow, f, indent=2)
+    with open(output, 'wb') as f:
+        f.write(encode_json(workflow))
 
     print(f"Exported to {output}")
 
@@ -236,7 +333,7 @@ def cmd_executions(client: N8nClient, args):
     )
 
     if args.json:
-        print(json.dumps(executions, indent=2))
+        write_json(executions)
     else:
         for ex in executions:
             print(format_execution(ex))
@@ -248,13 +345,15 @@ def cmd_execution(client: N8nClient, args):
     execution = client.get_execution(args.id)
 
     if args.json:
-        print(json.dumps(execution, indent=2))
+        write_json(execution)
     else:
         print(format_execution(execution))
         print(f"\nMode: {execution.get('mode', 'N/A')}")
 
+        result_data = (execution.get('data') or {}).get('resultData') or {}
+
         # Show node execution times
-        run_data = execution.get('data', {}).get('resultData', {}).get('runData', {})
+        run_data = result_data.get('runData') or {}
         if run_data:
             print("\nNode execution times:")
             for node_name, node_data in run_data.items():
@@ -263,7 +362,7 @@ def cmd_execution(client: N8nClient, args):
                     print(f"  - {node_name}: {exec_time}ms")
 
         # Show error if any
-        error = execution.get('data', {}).get('resultData', {}).get('error')
+        error = result_data.get('error')
         if error:
             print(f"\nError: {error.get('message', error)}")
 
@@ -274,17 +373,18 @@ def cmd_trigger(client: N8nClient, args):
     if args.data:
         data = json.loads(args.data)
     elif args.file:
-        with open(args.file, 'r') as f:
+        with open(args.file, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
     result = client.trigger_webhook(args.path, data, test=args.test)
-    print(json.dumps(result, indent=2))
+    write_json(result)
 
 
 def main():
     parser = argparse.ArgumentParser(description='n8n Workflow CRUD Operations')
     parser.add_argument('--url', default=N8N_URL, help='n8n API URL')
     parser.add_argument('--key', default=API_KEY, help='API key')
+    parser.add_argument('--no-cache', action='store_true', help='Disable response cache')
 
     subparsers = parser.add_subparsers(dest='command', help='Commands')
 
@@ -356,7 +456,7 @@ def main():
         print("Error: N8N_API_KEY not set", file=sys.stderr)
         sys.exit(1)
 
-    client = N8nClient(args.url, args.key)
+    client = N8nClient(args.url, args.key, use_cache=not args.no_cache)
 
     commands = {
         'list': cmd_list,